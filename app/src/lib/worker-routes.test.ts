@@ -28,6 +28,7 @@ const SANDBOX_ROUTES: Record<string, string> = {
   'browser-screenshot': 'browser-screenshot',
   'browser-extract': 'browser-extract',
   download: 'create-archive',
+  batch: 'batch',
 };
 
 // ---------------------------------------------------------------------------
@@ -76,6 +77,7 @@ describe('SANDBOX_ROUTES — completeness', () => {
     'browser-screenshot',
     'browser-extract',
     'download',
+    'batch',
   ];
 
   for (const route of expectedRoutes) {
@@ -45,6 +45,7 @@ const SANDBOX_ROUTES: Record<string, string> = {
   'browser-screenshot': 'browser-screenshot',
   'browser-extract': 'browser-extract',
   download: 'create-archive',
+  batch: 'batch',
 };
 
 export default {